@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from datetime import datetime
 
 from ..auth import get_current_wallet, require_moderator
 from ..database import supabase
 from ..models import ActivityCreate, ActivityUpdate, ActivityResponse
+from ..search import clean_filter, date_range
 
 router = APIRouter()
 
@@ -18,6 +20,34 @@ async def list_activities(active_only: bool = True):
     return result.data
 
 
+@router.get("/search", response_model=List[ActivityResponse])
+async def search_activities(
+    q: Optional[str] = None,
+    category: Optional[str] = None,
+    active_only: bool = True,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+):
+    """Search activities by keyword, category and date range, best matches first."""
+    created_from_iso, created_to_iso = date_range(created_from, created_to)
+
+    result = supabase.rpc(
+        "search_activities",
+        {
+            "p_query": clean_filter(q),
+            "p_category": clean_filter(category),
+            "p_active_only": active_only,
+            "p_created_from": created_from_iso,
+            "p_created_to": created_to_iso,
+            "p_limit": limit,
+            "p_offset": offset,
+        },
+    ).execute()
+    return result.data
+
+
 @router.get("/{activity_id}", response_model=ActivityResponse)
 async def get_activity(activity_id: str):
     """Get a single activity by ID."""
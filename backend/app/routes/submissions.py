@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List, Optional
 from datetime import datetime, timezone
 
@@ -11,6 +11,7 @@ from ..models import (
     DistributionRecord,
     DistributionResponse,
 )
+from ..search import clean_filter, clean_wallet_prefix, date_range
 
 router = APIRouter()
 
@@ -81,6 +82,40 @@ async def all_submissions(
     return submissions
 
 
+@router.get("/search", response_model=List[SubmissionResponse])
+async def search_submissions(
+    q: Optional[str] = None,
+    status: Optional[str] = Query(default=None, pattern=r"^(pending|approved|rejected)$"),
+    wallet: Optional[str] = None,
+    category: Optional[str] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(default=20, ge=1, le=100),
+    offset: int = Query(default=0, ge=0),
+    user: dict = Depends(require_moderator),
+):
+    """
+    Search submissions by proof text, status, wallet prefix, activity category
+    and date range, best matches first (moderators only).
+    """
+    created_from_iso, created_to_iso = date_range(created_from, created_to)
+
+    result = supabase.rpc(
+        "search_submissions",
+        {
+            "p_query": clean_filter(q),
+            "p_status": status,
+            "p_wallet": clean_wallet_prefix(wallet),
+            "p_category": clean_filter(category),
+            "p_created_from": created_from_iso,
+            "p_created_to": created_to_iso,
+            "p_limit": limit,
+            "p_offset": offset,
+        },
+    ).execute()
+    return result.data
+
+
 @router.post("/", response_model=SubmissionResponse)
 async def create_submission(
     body: SubmissionCreate,
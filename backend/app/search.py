@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from fastapi import HTTPException
+
+# Shorter prefixes can't use the trigram index and would scan the whole table
+MIN_WALLET_PREFIX_LENGTH = 3
+
+
+def clean_filter(value: Optional[str]) -> Optional[str]:
+    """Strip a filter value. Blank values mean "no filter"."""
+    if value is None:
+        return None
+    value = value.strip()
+    return value or None
+
+
+def clean_wallet_prefix(value: Optional[str]) -> Optional[str]:
+    """Clean a wallet prefix filter and make sure it is long enough to be indexed."""
+    value = clean_filter(value)
+    if value is not None and len(value) < MIN_WALLET_PREFIX_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"wallet must be at least {MIN_WALLET_PREFIX_LENGTH} characters",
+        )
+    return value
+
+
+def date_range(
+    created_from: Optional[datetime],
+    created_to: Optional[datetime],
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Validate a created_at range and return it as ISO strings for the database.
+    Timestamps without a timezone are treated as UTC.
+    """
+    if created_from and created_from.tzinfo is None:
+        created_from = created_from.replace(tzinfo=timezone.utc)
+    if created_to and created_to.tzinfo is None:
+        created_to = created_to.replace(tzinfo=timezone.utc)
+
+    if created_from and created_to and created_from > created_to:
+        raise HTTPException(status_code=400, detail="created_from must be before created_to")
+
+    return (
+        created_from.isoformat() if created_from else None,
+        created_to.isoformat() if created_to else None,
+    )
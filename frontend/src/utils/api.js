@@ -37,6 +37,9 @@ export const login = (walletAddress, signature, message) =>
 export const getActivities = (activeOnly = true) =>
   api.get('/api/activities/', { params: { active_only: activeOnly } });
 
+export const searchActivities = (params) =>
+  api.get('/api/activities/search', { params });
+
 export const getActivity = (id) =>
   api.get(`/api/activities/${id}`);
 
@@ -59,6 +62,9 @@ export const getPendingSubmissions = () =>
 export const getAllSubmissions = (status) =>
   api.get('/api/submissions/all', { params: status ? { status } : {} });
 
+export const searchSubmissions = (params) =>
+  api.get('/api/submissions/search', { params });
+
 export const createSubmission = (data) =>
   api.post('/api/submissions/', data);
 
@@ -72,6 +72,202 @@ CREATE TABLE token_distributions (
 CREATE INDEX idx_distributions_submission ON token_distributions(submission_id);
 CREATE INDEX idx_distributions_to ON token_distributions(to_wallet);
 
+-- ==========================================
+-- 5. Search - full-text and trigram indexes
+-- ==========================================
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Weighted full-text documents as expression indexes. search_activities and
+-- search_submissions repeat these expressions exactly so the planner matches them.
+CREATE INDEX IF NOT EXISTS idx_activities_search ON activities USING GIN ((
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(category, '')), 'C')
+));
+CREATE INDEX IF NOT EXISTS idx_activities_title_trgm ON activities USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_activities_created_id ON activities(created_at DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_submissions_search ON submissions USING GIN ((
+    setweight(to_tsvector('english', coalesce(proof_text, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(review_note, '')), 'B')
+));
+CREATE INDEX IF NOT EXISTS idx_submissions_proof_trgm ON submissions USING GIN (proof_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_submissions_wallet_trgm ON submissions USING GIN (wallet_address gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_submissions_created_id ON submissions(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_submissions_status_created ON submissions(status, created_at DESC, id DESC);
+
+-- Escape LIKE wildcards so user input is matched literally
+CREATE OR REPLACE FUNCTION escape_like(p_value TEXT)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE
+AS $$
+    SELECT replace(replace(replace(p_value, '\', '\\'), '%', '\%'), '_', '\_');
+$$;
+
+-- Ranked, paginated activity search (called from /api/activities/search).
+-- Only the supplied filters are added to the query, and EXECUTE plans it with
+-- the real values, so each filter can use its index. Without a text query the
+-- results come newest first, read in order from idx_activities_created_id.
+-- Pagination is LIMIT/OFFSET: a page costs more the further in it starts.
+CREATE OR REPLACE FUNCTION search_activities(
+    p_query TEXT DEFAULT NULL,
+    p_category TEXT DEFAULT NULL,
+    p_active_only BOOLEAN DEFAULT TRUE,
+    p_created_from TIMESTAMPTZ DEFAULT NULL,
+    p_created_to TIMESTAMPTZ DEFAULT NULL,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    description TEXT,
+    token_reward INTEGER,
+    category TEXT,
+    is_active BOOLEAN,
+    created_by TEXT,
+    created_at TIMESTAMPTZ,
+    rank REAL
+)
+LANGUAGE plpgsql STABLE
+AS $$
+DECLARE
+    -- Must match the idx_activities_search expression
+    v_document TEXT := $doc$(
+        setweight(to_tsvector('english', coalesce(a.title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(a.description, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(a.category, '')), 'C')
+    )$doc$;
+    v_rank TEXT := '0::REAL';
+    v_match TEXT;
+    v_where TEXT := 'TRUE';
+    v_order TEXT := 'a.created_at DESC, a.id DESC';
+BEGIN
+    IF p_query IS NOT NULL THEN
+        v_rank := format(
+            'ts_rank(%s, websearch_to_tsquery(''english'', $1)) + similarity(a.title, $1)',
+            v_document
+        );
+        v_match := format('%s @@ websearch_to_tsquery(''english'', $1)', v_document);
+        -- Shorter text can't use the trigram index, so only full-text applies
+        IF length(p_query) >= 3 THEN
+            v_match := v_match || ' OR a.title ILIKE $2';
+        END IF;
+        v_where := v_where || ' AND (' || v_match || ')';
+        v_order := 'rank DESC, ' || v_order;
+    END IF;
+    IF p_category IS NOT NULL THEN
+        v_where := v_where || ' AND a.category = $3';
+    END IF;
+    IF p_active_only THEN
+        v_where := v_where || ' AND a.is_active';
+    END IF;
+    IF p_created_from IS NOT NULL THEN
+        v_where := v_where || ' AND a.created_at >= $4';
+    END IF;
+    IF p_created_to IS NOT NULL THEN
+        v_where := v_where || ' AND a.created_at <= $5';
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT a.id, a.title, a.description, a.token_reward, a.category,
+                a.is_active, a.created_by, a.created_at, %s AS rank
+         FROM activities a
+         WHERE %s
+         ORDER BY %s
+         LIMIT $6 OFFSET $7',
+        v_rank, v_where, v_order
+    )
+    USING p_query, '%' || escape_like(p_query) || '%', p_category,
+          p_created_from, p_created_to, p_limit, p_offset;
+END;
+$$;
+
+-- Ranked, paginated submission search (called from /api/submissions/search).
+-- Built the same way as search_activities.
+CREATE OR REPLACE FUNCTION search_submissions(
+    p_query TEXT DEFAULT NULL,
+    p_status TEXT DEFAULT NULL,
+    p_wallet TEXT DEFAULT NULL,
+    p_category TEXT DEFAULT NULL,
+    p_created_from TIMESTAMPTZ DEFAULT NULL,
+    p_created_to TIMESTAMPTZ DEFAULT NULL,
+    p_limit INTEGER DEFAULT 20,
+    p_offset INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+    id UUID,
+    activity_id UUID,
+    wallet_address TEXT,
+    proof_text TEXT,
+    proof_url TEXT,
+    status TEXT,
+    reviewer_wallet TEXT,
+    review_note TEXT,
+    created_at TIMESTAMPTZ,
+    reviewed_at TIMESTAMPTZ,
+    activity_title TEXT,
+    token_reward INTEGER,
+    rank REAL
+)
+LANGUAGE plpgsql STABLE
+AS $$
+DECLARE
+    -- Must match the idx_submissions_search expression
+    v_document TEXT := $doc$(
+        setweight(to_tsvector('english', coalesce(s.proof_text, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(s.review_note, '')), 'B')
+    )$doc$;
+    v_rank TEXT := '0::REAL';
+    v_match TEXT;
+    v_where TEXT := 'TRUE';
+    v_order TEXT := 's.created_at DESC, s.id DESC';
+BEGIN
+    IF p_query IS NOT NULL THEN
+        v_rank := format(
+            'ts_rank(%s, websearch_to_tsquery(''english'', $1)) + similarity(s.proof_text, $1)',
+            v_document
+        );
+        v_match := format('%s @@ websearch_to_tsquery(''english'', $1)', v_document);
+        IF length(p_query) >= 3 THEN
+            v_match := v_match || ' OR s.proof_text ILIKE $2';
+        END IF;
+        v_where := v_where || ' AND (' || v_match || ')';
+        v_order := 'rank DESC, ' || v_order;
+    END IF;
+    IF p_status IS NOT NULL THEN
+        v_where := v_where || ' AND s.status = $3';
+    END IF;
+    IF p_wallet IS NOT NULL THEN
+        v_where := v_where || ' AND s.wallet_address LIKE $4';
+    END IF;
+    IF p_category IS NOT NULL THEN
+        v_where := v_where || ' AND a.category = $5';
+    END IF;
+    IF p_created_from IS NOT NULL THEN
+        v_where := v_where || ' AND s.created_at >= $6';
+    END IF;
+    IF p_created_to IS NOT NULL THEN
+        v_where := v_where || ' AND s.created_at <= $7';
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT s.id, s.activity_id, s.wallet_address, s.proof_text, s.proof_url,
+                s.status, s.reviewer_wallet, s.review_note, s.created_at, s.reviewed_at,
+                a.title, a.token_reward, %s AS rank
+         FROM submissions s
+         JOIN activities a ON a.id = s.activity_id
+         WHERE %s
+         ORDER BY %s
+         LIMIT $8 OFFSET $9',
+        v_rank, v_where, v_order
+    )
+    USING p_query, '%' || escape_like(p_query) || '%', p_status,
+          escape_like(p_wallet) || '%', p_category, p_created_from, p_created_to,
+          p_limit, p_offset;
+END;
+$$;
+
 -- ==========================================
 -- Insert your wallet as the first moderator
 -- Replace with your actual Solana wallet address!